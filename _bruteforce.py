@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Brute-force top-k distance kernel, used as a fallback when the sqlite-vec
+extension is unavailable and by re-ranking passes.
+
+With numba installed the kernel is JIT-compiled (parallel + fastmath,
+cached on disk so the compile cost is paid once); otherwise it falls back
+to a BLAS matrix product, which is still SIMD-optimized.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _distances(mat, q):
+        n = mat.shape[0]
+        out = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            dot = np.float32(0.0)
+            for j in range(mat.shape[1]):
+                dot += mat[i, j] * q[j]
+            out[i] = np.float32(1.0) - dot
+        return out
+
+except ImportError:
+    def _distances(mat, q):
+        return np.float32(1.0) - mat @ q
+
+
+def topk(mat, q, k):
+    """Return (indices, distances) of the k rows of mat nearest to q.
+
+    Expects L2-normalized float32 vectors, so cosine distance reduces to
+    1 - dot product.
+    """
+    mat = np.ascontiguousarray(mat, dtype=np.float32)
+    q = np.ascontiguousarray(q, dtype=np.float32)
+    dist = _distances(mat, q)
+
+    k = min(k, len(dist))
+    if k == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    idx = np.argpartition(dist, k - 1)[:k]
+    order = idx[np.argsort(dist[idx])]
+    return order, dist[order]
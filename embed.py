@@ -7,15 +7,23 @@ Run with: python embed.py [--process-queue] [--init-vec]
 """
 
 import argparse
+import array
 import json
 import os
+import re
 import sqlite3
 import sys
+import time
+from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+
 # Lazy imports for heavy libraries
 _model = None
-_vec_loaded = False
+
+# Embedding dimensions from embedding_config, cached per process
+_dims = None
 
 
 def get_db_path():
@@ -23,57 +31,241 @@ def get_db_path():
     return os.environ.get("HEXMEM_DB", os.path.expanduser("~/clawd/hexmem/hexmem.db"))
 
 
+def tune_connection(conn):
+    """Apply performance PRAGMAs: WAL journaling, relaxed fsync, memory temp
+    store, 256MB mmap and a 64MB page cache. Safe for concurrent readers."""
+    conn.executescript("""
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA cache_size = -65536;
+    """)
+
+
 def load_sqlite_vec(conn):
-    """Load sqlite-vec extension into connection."""
-    global _vec_loaded
-    if _vec_loaded:
+    """Load sqlite-vec extension into connection.
+
+    Load state is checked on the connection itself (via vec_version()) -
+    a single module-level flag would skip the load, and silently break
+    vec queries, on any second connection opened in the same process,
+    e.g. in daemon mode.
+    """
+    try:
+        conn.execute("SELECT vec_version()")
         return True
-    
+    except sqlite3.OperationalError:
+        pass
+
     try:
         import sqlite_vec
         conn.enable_load_extension(True)
         sqlite_vec.load(conn)
+        try:
+            # Optional HNSW backend; vec0 stays the default (see HEXMEM_ANN)
+            import vectorlite_py
+            conn.load_extension(vectorlite_py.vectorlite_path())
+        except Exception:
+            pass
         conn.enable_load_extension(False)
-        _vec_loaded = True
         return True
     except Exception as e:
         print(f"Warning: Could not load sqlite-vec: {e}", file=sys.stderr)
         return False
 
 
+def _is_vectorlite(conn, table):
+    """True if the given vec table was created with the vectorlite backend."""
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = ?", (table,)).fetchone()
+    return bool(row and row[0] and 'vectorlite' in row[0])
+
+
+def knn_subquery(conn, source, vec_table, id_col):
+    """Build the per-table KNN subquery for a UNION ALL search.
+
+    vec0 tables brute-force O(n) distance scans; tables created with
+    HEXMEM_ANN=1 use vectorlite's HNSW index (O(log n)) and a different
+    KNN syntax, so the right form is picked per table.
+    """
+    if _is_vectorlite(conn, vec_table):
+        return f"""
+            SELECT '{source}' AS source, rowid AS id, distance
+            FROM {vec_table}
+            WHERE knn_search(embedding, knn_param(:q, :k))
+        """
+    # A bare blob always binds as float32; int8 tables need the explicit
+    # vec_int8() cast or the MATCH rejects the query vector
+    match = 'vec_int8(:q)' if _is_int8(conn, vec_table) else ':q'
+    return f"""
+        SELECT '{source}' AS source, {id_col} AS id, distance
+        FROM {vec_table}
+        WHERE embedding MATCH {match} AND k = :k
+    """
+
+
+class _StaticModelWrapper:
+    """Adapt model2vec's StaticModel to the SentenceTransformer.encode API."""
+
+    def __init__(self, model):
+        self._model = model
+
+    def encode(self, texts, batch_size=32, **kwargs):
+        emb = np.asarray(self._model.encode(texts), dtype='float32')
+        # Match the transformer path: unit-norm output
+        norms = np.linalg.norm(emb, axis=-1, keepdims=True)
+        return emb / np.maximum(norms, 1e-12)
+
+
 def get_embedding_model():
-    """Lazy-load the embedding model."""
+    """Lazy-load the embedding model.
+
+    Set HEXMEM_EMBED_BACKEND=model2vec to use a distilled static-embedding
+    model instead of the transformer — typically 100-500x faster on CPU,
+    at some quality cost. Its dimensions may differ from embedding_config;
+    re-run --init-vec after switching backends.
+
+    Prefers the ONNX backend with the pre-quantized int8 model file
+    (~2-4x faster CPU inference than the default PyTorch backend); falls
+    back to PyTorch if onnxruntime or the quantized file is unavailable.
+    """
     global _model
     if _model is None:
+        if os.environ.get('HEXMEM_EMBED_BACKEND') == 'model2vec':
+            from model2vec import StaticModel
+            _model = _StaticModelWrapper(StaticModel.from_pretrained('minishlab/potion-base-8M'))
+            return _model
+        # Default ORT thread count (= all cores) thrashes on small batches;
+        # half the cores intra-op and a single inter-op thread works better
+        # for a CLI batch encoder. Override with HEXMEM_THREADS.
+        n_threads = int(os.environ.get('HEXMEM_THREADS', 0)) or max(1, (os.cpu_count() or 2) // 2)
+        os.environ.setdefault('OMP_NUM_THREADS', str(n_threads))
+        os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+
         from sentence_transformers import SentenceTransformer
-        _model = SentenceTransformer('all-MiniLM-L6-v2')
+        try:
+            import onnxruntime
+            so = onnxruntime.SessionOptions()
+            so.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            so.intra_op_num_threads = n_threads
+            so.inter_op_num_threads = 1
+            _model = SentenceTransformer(
+                'all-MiniLM-L6-v2',
+                backend='onnx',
+                model_kwargs={'file_name': 'onnx/model_qint8_avx512_vnni.onnx',
+                              'session_options': so},
+            )
+        except Exception as e:
+            print(f"Warning: ONNX backend unavailable ({e}), using PyTorch", file=sys.stderr)
+            _model = SentenceTransformer('all-MiniLM-L6-v2')
     return _model
 
 
-def generate_embedding(text: str) -> list[float]:
-    """Generate embedding vector for text."""
+def generate_embedding(text: str) -> np.ndarray:
+    """Generate embedding vector for text as a unit-norm float32 array.
+
+    Embeddings are L2-normalized at write time so the cosine distance in
+    the vec tables reduces to a dot product (no sqrt, half the FLOPs of
+    L2 over raw vectors).
+    """
+    model = get_embedding_model()
+    embedding = model.encode(text, convert_to_numpy=True,
+                             normalize_embeddings=True)
+    return embedding.astype('float32')
+
+
+def generate_embedding_batch(texts) -> np.ndarray:
+    """Embed a list of texts in one forward pass, returning (N, dim).
+
+    One batched encode keeps the model's SIMD lanes full instead of
+    running N batch-1 passes; same normalization contract as
+    generate_embedding.
+    """
     model = get_embedding_model()
-    embedding = model.encode(text, convert_to_numpy=True)
-    return embedding.astype('float32').tolist()
+    embeddings = model.encode(list(texts), convert_to_numpy=True,
+                              normalize_embeddings=True, batch_size=32)
+    return embeddings.astype('float32')
+
+
+def rerank(query_vec, candidate_matrix) -> np.ndarray:
+    """Cosine distances of candidate rows against a query, batched.
+
+    One BLAS/ufunc call over the whole matrix instead of a per-row
+    np.dot loop: np.vecdot on NumPy >= 2.0, matrix-vector product
+    (sgemv) otherwise - both hit the platform's SIMD kernels. Inputs
+    are unit-norm (see generate_embedding), so 1 - dot is the cosine
+    distance. Used to re-score ANN candidates in float32.
+    """
+    mat = np.ascontiguousarray(candidate_matrix, dtype=np.float32)
+    q = np.ascontiguousarray(query_vec, dtype=np.float32)
+    if hasattr(np, 'vecdot'):
+        sims = np.vecdot(mat, q[np.newaxis, :])
+    else:
+        sims = mat @ q
+    return np.float32(1.0) - sims
+
+
+def warmup():
+    """Encode a dummy string to force model load and backend graph
+    optimization ahead of the first real request."""
+    generate_embedding("warmup")
 
 
-def serialize_embedding(embedding: list[float]) -> bytes:
+def serialize_embedding(embedding) -> bytes:
     """Serialize embedding to binary format for sqlite-vec."""
-    import struct
-    return struct.pack(f'{len(embedding)}f', *embedding)
+    if isinstance(embedding, np.ndarray):
+        return np.ascontiguousarray(embedding, dtype=np.float32).tobytes()
+    # Plain sequences: array.array packs in C without per-element splat
+    return array.array('f', embedding).tobytes()
+
+
+def quantize_embedding_int8(embedding) -> bytes:
+    """Quantize a float32 embedding to int8 for compact vec storage.
+
+    A fixed 127x scale (clipped to [-1, 1]) keeps distances comparable
+    across vectors, unlike per-vector scaling; MiniLM components sit
+    comfortably inside that range.
+    """
+    arr = np.asarray(embedding, dtype=np.float32)
+    return (np.clip(arr, -1.0, 1.0) * 127).round().astype(np.int8).tobytes()
+
+
+def _is_int8(conn, table):
+    """True if the given vec table stores int8-quantized embeddings."""
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = ?", (table,)).fetchone()
+    return bool(row and row[0] and 'int8[' in row[0])
+
+
+def query_blob(conn, embedding, vec_table) -> bytes:
+    """Serialize a query embedding to match a vec table's storage type."""
+    if _is_int8(conn, vec_table):
+        return quantize_embedding_int8(embedding)
+    return serialize_embedding(embedding)
+
+
+def get_dims(conn):
+    """Get embedding dimensions from config, cached after the first query."""
+    global _dims
+    if _dims is None:
+        cur = conn.execute("SELECT dimensions FROM embedding_config WHERE id = 1")
+        row = cur.fetchone()
+        _dims = row[0] if row else 384
+    return _dims
 
 
 def init_vec_tables(conn):
     """Initialize vec0 virtual tables for vector search."""
+    global _dims
     if not load_sqlite_vec(conn):
         print("Cannot initialize vec tables without sqlite-vec extension")
         return False
-    
-    # Get embedding dimensions from config
-    cur = conn.execute("SELECT dimensions FROM embedding_config WHERE id = 1")
-    row = cur.fetchone()
-    dimensions = row[0] if row else 384
-    
+
+    # Re-read the config here - --init-vec is the one path where the
+    # configured dimensions may just have changed
+    _dims = None
+    dimensions = get_dims(conn)
+
     # Create vec0 virtual tables for each source
     tables = [
         ("vec_events", "event_id"),
@@ -83,14 +275,52 @@ def init_vec_tables(conn):
         ("vec_seeds", "seed_id"),
     ]
     
+    # HEXMEM_ANN=1 builds vectorlite HNSW tables (approximate but O(log n)
+    # per query) instead of vec0's exact brute-force scan
+    use_ann = False
+    if os.environ.get('HEXMEM_ANN') == '1':
+        try:
+            conn.execute("SELECT vectorlite_info()")
+            use_ann = True
+        except sqlite3.OperationalError:
+            print("Warning: HEXMEM_ANN=1 but vectorlite is not available, using vec0",
+                  file=sys.stderr)
+
     for table_name, id_col in tables:
         try:
-            conn.execute(f"""
-                CREATE VIRTUAL TABLE IF NOT EXISTS {table_name} USING vec0(
-                    {id_col} INTEGER PRIMARY KEY,
-                    embedding float[{dimensions}]
-                )
-            """)
+            # CREATE IF NOT EXISTS never rebuilds an existing table, so a
+            # dims change (e.g. after switching embedding backends) would
+            # silently no-op and every later insert would fail with a
+            # dimension mismatch. Drop and recreate when the declared dims
+            # differ; the vectors are lost, but re-queue + --process-queue
+            # regenerates them from source rows.
+            row = conn.execute("SELECT sql FROM sqlite_master WHERE name = ?",
+                               (table_name,)).fetchone()
+            if row and row[0]:
+                m = re.search(r'\[(\d+)\]', row[0])
+                if m and int(m.group(1)) != dimensions:
+                    print(f"Rebuilding {table_name}: {m.group(1)} -> {dimensions} dims")
+                    conn.execute(f"DROP TABLE {table_name}")
+
+            # Embeddings are unit-norm at write time, so cosine distance is
+            # a plain dot product - cheaper than L2 over the same scan
+            if use_ann:
+                conn.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {table_name} USING vectorlite(
+                        embedding float32[{dimensions}] cosine,
+                        hnsw(max_elements=100000)
+                    )
+                """)
+            else:
+                # HEXMEM_VEC_INT8=1 stores int8-quantized vectors: 4x less
+                # scan bandwidth and storage at a small recall cost
+                elem_type = 'int8' if os.environ.get('HEXMEM_VEC_INT8') == '1' else 'float'
+                conn.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {table_name} USING vec0(
+                        {id_col} INTEGER PRIMARY KEY,
+                        embedding {elem_type}[{dimensions}] distance_metric=cosine
+                    )
+                """)
             print(f"Created/verified {table_name}")
         except sqlite3.OperationalError as e:
             if "already exists" not in str(e):
@@ -100,8 +330,22 @@ def init_vec_tables(conn):
     return True
 
 
-def process_queue(conn, limit: int = 100):
-    """Process pending items in the embedding queue."""
+def _encode_chunk(texts):
+    """Worker entry point: encode one chunk with a single-threaded model."""
+    os.environ['HEXMEM_THREADS'] = '1'
+    model = get_embedding_model()
+    return model.encode(texts, batch_size=64, convert_to_numpy=True,
+                        normalize_embeddings=True, show_progress_bar=False)
+
+
+def process_queue(conn, limit: int = 100, workers: int = 1):
+    """Process pending items in the embedding queue.
+
+    With workers > 1, the pending texts are split across a multiprocessing
+    pool with one single-threaded model per worker - ORT only releases the
+    GIL inside the session, so separate processes scale better for large
+    backlogs.
+    """
     if not load_sqlite_vec(conn):
         print("Cannot process queue without sqlite-vec extension")
         return 0
@@ -121,7 +365,7 @@ def process_queue(conn, limit: int = 100):
         return 0
     
     print(f"Processing {len(pending)} items...")
-    
+
     # Table name mapping
     vec_tables = {
         'events': ('vec_events', 'event_id'),
@@ -130,46 +374,115 @@ def process_queue(conn, limit: int = 100):
         'entities': ('vec_entities', 'entity_id'),
         'memory_seeds': ('vec_seeds', 'seed_id'),
     }
-    
-    processed = 0
-    for queue_id, source_table, source_id, text in pending:
-        try:
-            # Generate embedding
-            embedding = generate_embedding(text)
-            embedding_blob = serialize_embedding(embedding)
-            
-            # Get vec table info
-            vec_table, id_col = vec_tables.get(source_table, (None, None))
-            if not vec_table:
-                raise ValueError(f"Unknown source table: {source_table}")
-            
-            # Insert into vec table
-            conn.execute(f"""
-                INSERT OR REPLACE INTO {vec_table} ({id_col}, embedding)
+
+    # Encode everything in one batched call. Sorting by text length keeps
+    # each batch padded to similar token counts, which is the main
+    # sentence-transformers throughput win over per-item encode() calls.
+    texts = [row[3] for row in pending]
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    sorted_texts = [texts[i] for i in order]
+    if workers > 1:
+        from multiprocessing import Pool
+        chunk_size = (len(sorted_texts) + workers - 1) // workers
+        chunks = [sorted_texts[i:i + chunk_size]
+                  for i in range(0, len(sorted_texts), chunk_size)]
+        with Pool(len(chunks)) as pool:
+            encoded = np.concatenate(pool.map(_encode_chunk, chunks))
+    else:
+        model = get_embedding_model()
+        encoded = model.encode(sorted_texts, batch_size=64,
+                               convert_to_numpy=True, normalize_embeddings=True,
+                               show_progress_bar=False)
+    embeddings = [None] * len(texts)
+    for pos, i in enumerate(order):
+        embeddings[i] = encoded[pos]
+
+    # Bucket rows per vec table, keeping each row's queue id so a failed
+    # batch can be retried row by row below.
+    vec_rows = defaultdict(list)
+    failed = []
+    int8_tables = {vt: _is_int8(conn, vt) for vt, _ in vec_tables.values()}
+    # Progress is throttled to ~1/s on stderr; unthrottled per-row prints
+    # are synchronous under a pty and add up on large batches
+    last_print = 0.0
+    for n, ((queue_id, source_table, source_id, text), embedding) in enumerate(zip(pending, embeddings), 1):
+        vec_table, id_col = vec_tables.get(source_table, (None, None))
+        if not vec_table:
+            failed.append((f"Unknown source table: {source_table}", queue_id))
+            continue
+        blob = (quantize_embedding_int8(embedding) if int8_tables[vec_table]
+                else serialize_embedding(embedding))
+        vec_rows[(vec_table, id_col)].append((queue_id, source_id, blob))
+        if time.monotonic() - last_print > 1.0:
+            sys.stderr.write(f"\r  {n}/{len(pending)}")
+            last_print = time.monotonic()
+    if last_print:
+        sys.stderr.write("\n")
+
+    def write_rows(vec_table, id_col, rows):
+        # Neither backend replaces an existing key in place (vec0 raises a
+        # UNIQUE failure on OR REPLACE, vectorlite has no REPLACE at all),
+        # so drop any stale vector before inserting
+        if _is_vectorlite(conn, vec_table):
+            conn.executemany(f"DELETE FROM {vec_table} WHERE rowid = ?",
+                             [(sid,) for sid, _ in rows])
+            conn.executemany(f"""
+                INSERT INTO {vec_table} (rowid, embedding)
                 VALUES (?, ?)
-            """, (source_id, embedding_blob))
-            
-            # Mark as done
-            conn.execute("""
-                UPDATE embedding_queue 
-                SET status = 'done', processed_at = datetime('now')
-                WHERE id = ?
-            """, (queue_id,))
-            
-            processed += 1
-            if processed % 10 == 0:
-                print(f"  Processed {processed}/{len(pending)}...")
-                conn.commit()
-                
-        except Exception as e:
-            # Mark as failed
-            conn.execute("""
-                UPDATE embedding_queue 
-                SET status = 'failed', error_message = ?, processed_at = datetime('now')
-                WHERE id = ?
-            """, (str(e), queue_id))
-    
-    conn.commit()
+            """, rows)
+            return
+        # int8 tables need the vec_int8() cast on insert - a bare blob
+        # binds as float32 and vec0 rejects it
+        value = 'vec_int8(?)' if int8_tables[vec_table] else '?'
+        conn.executemany(f"DELETE FROM {vec_table} WHERE {id_col} = ?",
+                         [(sid,) for sid, _ in rows])
+        conn.executemany(f"""
+            INSERT INTO {vec_table} ({id_col}, embedding)
+            VALUES (?, {value})
+        """, rows)
+
+    mark_done = """
+        UPDATE embedding_queue
+        SET status = 'done', processed_at = datetime('now')
+        WHERE id = ?
+    """
+    mark_failed = """
+        UPDATE embedding_queue
+        SET status = 'failed', error_message = ?, processed_at = datetime('now')
+        WHERE id = ?
+    """
+
+    # Write everything in one transaction: two executemany passes per
+    # table instead of per-row execute + commit-every-10.
+    done = [(queue_id,)
+            for rows in vec_rows.values() for queue_id, _, _ in rows]
+    try:
+        with conn:
+            for (vec_table, id_col), rows in vec_rows.items():
+                write_rows(vec_table, id_col, [r[1:] for r in rows])
+            conn.executemany(mark_done, done)
+            conn.executemany(mark_failed, failed)
+    except sqlite3.Error as e:
+        # One bad row (e.g. a dimension mismatch after a backend switch)
+        # rolled back the whole batch. Degrade to per-row writes so the
+        # unrelated items still land and only the offenders are marked
+        # failed - otherwise the queue wedges on every subsequent run,
+        # which is fatal for the HEXMEM_DAEMON polling loop.
+        print(f"Warning: batched write failed ({e}), retrying per row",
+              file=sys.stderr)
+        done = []
+        with conn:
+            for (vec_table, id_col), rows in vec_rows.items():
+                for queue_id, source_id, blob in rows:
+                    try:
+                        write_rows(vec_table, id_col, [(source_id, blob)])
+                        done.append((queue_id,))
+                    except sqlite3.Error as row_err:
+                        failed.append((str(row_err), queue_id))
+            conn.executemany(mark_done, done)
+            conn.executemany(mark_failed, failed)
+
+    processed = len(done)
     print(f"Processed {processed} items")
     return processed
 
@@ -182,10 +495,9 @@ def search_similar(conn, query: str, source_table: str = None, limit: int = 10):
     
     # Generate query embedding
     embedding = generate_embedding(query)
-    embedding_blob = serialize_embedding(embedding)
-    
+
     results = []
-    
+
     # Search each vec table (or just the specified one)
     tables_to_search = []
     if source_table:
@@ -205,36 +517,48 @@ def search_similar(conn, query: str, source_table: str = None, limit: int = 10):
             ('entities', 'vec_entities'),
         ]
     
+    # Fuse the per-table searches into one UNION ALL so SQLite merges the
+    # top-k itself, instead of a Python loop with a sort afterwards.
+    # 'k = :k' activates vec0's indexed KNN operator; a bare LIMIT can
+    # silently fall back to a full-table distance scan.
+    subqueries = []
     for source, vec_table in tables_to_search:
         if not vec_table:
             continue
-        
+
         id_col = f"{source.rstrip('s')}_id" if source != 'entities' else 'entity_id'
         if source == 'memory_seeds':
             id_col = 'seed_id'
-        
-        try:
-            cur = conn.execute(f"""
-                SELECT {id_col}, distance
-                FROM {vec_table}
-                WHERE embedding MATCH ?
-                ORDER BY distance
-                LIMIT ?
-            """, (embedding_blob, limit))
-            
-            for row in cur.fetchall():
-                results.append({
-                    'source': source,
-                    'id': row[0],
-                    'distance': row[1],
-                })
-        except sqlite3.OperationalError as e:
-            # Table might not exist yet
-            pass
-    
-    # Sort by distance
-    results.sort(key=lambda x: x['distance'])
-    return results[:limit]
+
+        subqueries.append(knn_subquery(conn, source, vec_table, id_col))
+
+    if not subqueries:
+        return results
+
+    # Match the query blob to the tables' storage type (float32 or int8)
+    embedding_blob = query_blob(conn, embedding, tables_to_search[0][1])
+
+    # With one source there is no compound for the outer LIMIT to attach
+    # to: SQLite pushes it into the vec0 query, which rejects LIMIT
+    # alongside k = :k. The k constraint already bounds and distance-orders
+    # the rows, so the lone subquery runs as-is.
+    if len(subqueries) == 1:
+        sql = subqueries[0]
+    else:
+        sql = " UNION ALL ".join(subqueries) + " ORDER BY distance LIMIT :k"
+    try:
+        cur = conn.execute(sql, {'q': embedding_blob, 'k': limit})
+        for row in cur:
+            results.append({
+                'source': row[0],
+                'id': row[1],
+                'distance': row[2],
+            })
+    except sqlite3.OperationalError as e:
+        # Vec tables might not exist yet - run --init-vec first
+        print(f"Warning: vector search failed: {e}", file=sys.stderr)
+
+    return results
 
 
 def main():
@@ -245,6 +569,8 @@ def main():
                        help='Process pending items in embedding queue')
     parser.add_argument('--limit', type=int, default=100,
                        help='Max items to process (default: 100)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Encoder worker processes for --process-queue (default: 1)')
     parser.add_argument('--search', type=str,
                        help='Search for similar items')
     parser.add_argument('--source', type=str,
@@ -255,14 +581,30 @@ def main():
     args = parser.parse_args()
     
     db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    
+    # Bump the prepared-statement cache: the per-table INSERTs expand to
+    # several distinct SQL strings that should all stay compiled,
+    # especially across daemon-mode iterations.
+    conn = sqlite3.connect(db_path, cached_statements=256)
+    tune_connection(conn)
+
     if args.init_vec:
         init_vec_tables(conn)
     
     if args.process_queue:
-        process_queue(conn, args.limit)
-    
+        if os.environ.get('HEXMEM_DAEMON') == '1':
+            # Long-running mode: pay the model load once, then keep polling
+            # the queue instead of relaunching Python per batch.
+            warmup()
+            print("Daemon mode: polling embedding queue (Ctrl-C to stop)")
+            try:
+                while True:
+                    process_queue(conn, args.limit, args.workers)
+                    time.sleep(5)
+            except KeyboardInterrupt:
+                pass
+        else:
+            process_queue(conn, args.limit, args.workers)
+
     if args.search:
         results = search_similar(conn, args.search, args.source, args.limit)
         print(json.dumps(results, indent=2))
@@ -0,0 +1,19 @@
+-- Migration 013: Unix-epoch review timestamps
+-- Date: 2026-08-28
+--
+-- review.py parses the ISO last_reviewed_at string on every review just to
+-- compute hours-since-review. Storing the timestamp as INTEGER unix seconds
+-- makes that a single subtraction (and lets SQL use strftime('%s','now')
+-- instead of double JULIANDAY). The ISO columns stay for compatibility.
+
+ALTER TABLE events ADD COLUMN last_reviewed_at_epoch INTEGER;
+ALTER TABLE lessons ADD COLUMN last_reviewed_at_epoch INTEGER;
+
+-- Backfill from the existing ISO columns
+UPDATE events
+SET last_reviewed_at_epoch = CAST(strftime('%s', last_reviewed_at) AS INTEGER)
+WHERE last_reviewed_at IS NOT NULL;
+
+UPDATE lessons
+SET last_reviewed_at_epoch = CAST(strftime('%s', last_reviewed_at) AS INTEGER)
+WHERE last_reviewed_at IS NOT NULL;
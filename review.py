@@ -17,7 +17,8 @@ import json
 import math
 import os
 import sqlite3
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 
 HEXMEM_DB = os.environ.get("HEXMEM_DB", os.path.expanduser("~/clawd/hexmem/hexmem.db"))
 
@@ -26,7 +27,16 @@ INTERVALS = [0.33, 1, 24, 72, 168, 336, 720, 2160, 4320, 8760]
 
 
 def get_db():
-    return sqlite3.connect(HEXMEM_DB)
+    conn = sqlite3.connect(HEXMEM_DB)
+    # WAL + relaxed fsync + memory temp store; same tuning as embed.py
+    conn.executescript("""
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA cache_size = -65536;
+    """)
+    return conn
 
 
 def calculate_retention(hours_since_review: float, memory_strength: float) -> float:
@@ -114,32 +124,39 @@ def review_item(conn, source_table: str, source_id: int, quality: int):
         quality: 0-5 recall quality
     """
     now = datetime.utcnow().isoformat()
-    
+    now_epoch = int(time.time())
+
     # Get current state
     if source_table == 'events':
         cur = conn.execute("""
-            SELECT memory_strength, repetition_count, last_reviewed_at, occurred_at,
+            SELECT memory_strength, repetition_count, last_reviewed_at_epoch, occurred_at,
                    retention_estimate
             FROM events WHERE id = ?
         """, (source_id,))
     else:
         cur = conn.execute("""
-            SELECT memory_strength, repetition_count, last_reviewed_at, learned_at,
+            SELECT memory_strength, repetition_count, last_reviewed_at_epoch, learned_at,
                    retention_estimate
             FROM lessons WHERE id = ?
         """, (source_id,))
-    
+
     row = cur.fetchone()
     if not row:
         print(f"Item not found: {source_table}:{source_id}")
         return
-    
-    strength, rep_count, last_reviewed, created, retention = row
-    last_reviewed = last_reviewed or created
-    
-    # Calculate time since last review
-    last_dt = datetime.fromisoformat(last_reviewed.replace('Z', '+00:00').replace('+00:00', ''))
-    hours_since = (datetime.utcnow() - last_dt).total_seconds() / 3600
+
+    strength, rep_count, last_epoch, created, retention = row
+
+    # Hours since last review: one subtraction on the epoch column, falling
+    # back to parsing the ISO creation timestamp for never-reviewed items.
+    # occurred_at/learned_at are written by SQLite's datetime('now') in UTC,
+    # so pin tzinfo before converting - naive .timestamp() would apply the
+    # local offset (process_decay's strftime('%s', ...) already treats
+    # these strings as UTC).
+    if last_epoch is None:
+        created_dt = datetime.fromisoformat(created.replace('Z', ''))
+        last_epoch = int(created_dt.replace(tzinfo=timezone.utc).timestamp())
+    hours_since = (now_epoch - last_epoch) / 3600.0
     
     # Calculate current retention before review
     current_retention = calculate_retention(hours_since, strength)
@@ -168,20 +185,22 @@ def review_item(conn, source_table: str, source_id: int, quality: int):
                 memory_strength = ?,
                 repetition_count = ?,
                 last_reviewed_at = ?,
+                last_reviewed_at_epoch = ?,
                 next_review_at = ?,
                 retention_estimate = 1.0
             WHERE id = ?
-        """, (new_strength, new_rep_count, now, next_review, source_id))
+        """, (new_strength, new_rep_count, now, now_epoch, next_review, source_id))
     else:
         conn.execute("""
             UPDATE lessons SET
                 memory_strength = ?,
                 repetition_count = ?,
                 last_reviewed_at = ?,
+                last_reviewed_at_epoch = ?,
                 next_review_at = ?,
                 retention_estimate = 1.0
             WHERE id = ?
-        """, (new_strength, new_rep_count, now, next_review, source_id))
+        """, (new_strength, new_rep_count, now, now_epoch, next_review, source_id))
     
     # Log the review
     conn.execute("""
@@ -229,41 +248,54 @@ def process_decay(conn, dry_run: bool = True):
     """
     Process memory decay - mark very low retention items as forgotten.
     """
-    # Find items with very low retention that haven't been reviewed in a long time
+    # Lazy import: only --decay needs numpy, the other subcommands stay
+    # stdlib-only
+    import numpy as np
+
+    # Fetch raw inputs and evaluate the forgetting curve in one vectorized
+    # numpy pass, instead of running SQLite's scalar EXP() per row.
     cur = conn.execute("""
-        SELECT id, summary, importance,
-               ROUND(EXP(-((JULIANDAY('now') - JULIANDAY(COALESCE(last_reviewed_at, occurred_at))) * 24) / (memory_strength * 24)), 3) as retention
+        SELECT id, summary, importance, memory_strength,
+               (strftime('%s', 'now') - COALESCE(last_reviewed_at_epoch,
+                    strftime('%s', COALESCE(last_reviewed_at, occurred_at)))) / 86400.0 as days_since
         FROM events
         WHERE consolidation_state != 'forgotten'
           AND importance < 0.3
-          AND EXP(-((JULIANDAY('now') - JULIANDAY(COALESCE(last_reviewed_at, occurred_at))) * 24) / (memory_strength * 24)) < 0.1
     """)
-    
-    candidates = cur.fetchall()
-    
+    rows = cur.fetchall()
+
+    # R = e^(-t/S) with t in hours and S = strength*24 reduces to e^(-days/S)
+    days = np.array([r[4] for r in rows], dtype='float64')
+    strength = np.array([r[3] for r in rows], dtype='float64')
+    retention = np.exp(-days / strength) if len(rows) else np.empty(0)
+
+    candidates = [(rows[i][0], rows[i][1], rows[i][2], retention[i])
+                  for i in np.flatnonzero(retention < 0.1)]
+
     if not candidates:
         print("No memories ready for forgetting.")
         return
-    
+
     print(f"\n🗑️ Forgetting Candidates ({len(candidates)})\n")
-    
+
     for id, summary, importance, retention in candidates:
         preview = (summary[:40] + '...') if len(summary) > 40 else summary
         print(f"  [{id}] {preview}")
         print(f"      Importance: {importance:.2f} | Retention: {retention*100:.0f}%")
-    
+
     if dry_run:
         print("\n(Dry run - no changes made. Use --decay --apply to forget.)")
     else:
+        # Stage candidate ids in a temp table so the apply is one UPDATE
+        # statement instead of one per id.
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS decay_cand (id INTEGER PRIMARY KEY)")
+        conn.executemany("INSERT OR IGNORE INTO decay_cand (id) VALUES (?)",
+                         [(c[0],) for c in candidates])
         conn.execute("""
             UPDATE events SET consolidation_state = 'forgotten'
-            WHERE id IN (
-                SELECT id FROM events
-                WHERE consolidation_state != 'forgotten'
-                  AND importance < 0.3
-                  AND EXP(-((JULIANDAY('now') - JULIANDAY(COALESCE(last_reviewed_at, occurred_at))) * 24) / (memory_strength * 24)) < 0.1
-            )
+            WHERE id IN (SELECT id FROM decay_cand)
         """)
+        conn.execute("DROP TABLE decay_cand")
         conn.commit()
         print(f"\n✅ Marked {len(candidates)} items as forgotten.")
 
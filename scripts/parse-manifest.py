@@ -14,17 +14,24 @@ import argparse
 from datetime import datetime
 from pathlib import Path
 
+# libyaml-backed loader is 10-50x faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Database path
 HEXMEM_DB = Path(__file__).parent.parent / "hexmem.db"
 
 def parse_manifest(manifest_path):
     """Parse YAML manifest and extract approved items"""
-    with open(manifest_path, 'r') as f:
+    # Binary read lets the parser handle decoding itself
+    with open(manifest_path, 'rb') as f:
         content = f.read()
-    
+
     # Parse YAML (will only capture uncommented sections)
     try:
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         print(f"Error parsing YAML: {e}", file=sys.stderr)
         return None
@@ -69,11 +76,10 @@ def supersede_fact(conn, old_id, new_id):
     cursor = conn.cursor()
     now = datetime.now().isoformat()
     cursor.execute("""
-        UPDATE facts 
+        UPDATE facts
         SET valid_until = ?, superseded_by = ?
         WHERE id = ?
     """, (now, new_id, old_id))
-    conn.commit()
     print(f"   ✓ Superseded fact ID {old_id} with ID {new_id}")
 
 def supersede_lesson(conn, old_id, new_id):
@@ -85,9 +91,29 @@ def supersede_lesson(conn, old_id, new_id):
         SET valid_until = ?, superseded_by = ?
         WHERE id = ?
     """, (now, new_id, old_id))
-    conn.commit()
     print(f"   ✓ Superseded lesson ID {old_id} with ID {new_id}")
 
+def observation_row(obs):
+    """Row tuple for the batched facts INSERT"""
+    source_event_id = obs.get('source_event_id')
+    return (
+        obs.get('subject', 'hex'),
+        obs.get('predicate', 'observed'),
+        obs.get('object', ''),
+        obs.get('confidence', 0.8),
+        f"event:{source_event_id}" if source_event_id else None
+    )
+
+def insight_row(insight):
+    """Row tuple for the batched lessons INSERT"""
+    return (
+        insight.get('domain', 'general'),
+        insight.get('lesson', ''),
+        insight.get('context', ''),
+        insight.get('confidence', 0.7),
+        insight.get('source_event_id')
+    )
+
 def commit_observation(conn, obs, dry_run=False):
     """Commit observation as fact to database"""
     subject = obs.get('subject', 'hex')
@@ -113,10 +139,9 @@ def commit_observation(conn, obs, dry_run=False):
             confidence, source, source_session, created_at
         ) VALUES (?, ?, ?, 'string', ?, 'reflection', ?, datetime('now'))
     """, (subject, predicate, obj, confidence, f"event:{source_event_id}" if source_event_id else None))
-    
+
     new_id = cursor.lastrowid
-    conn.commit()
-    
+
     print(f"   ✓ Added fact ID {new_id}: {subject} | {predicate} | {obj}")
     
     # Handle supersession if requested
@@ -147,10 +172,9 @@ def commit_insight(conn, insight, dry_run=False):
             domain, lesson, context, confidence, source_event_id, created_at
         ) VALUES (?, ?, ?, ?, ?, datetime('now'))
     """, (domain, lesson, context, confidence, source_event_id))
-    
+
     new_id = cursor.lastrowid
-    conn.commit()
-    
+
     print(f"   ✓ Added lesson ID {new_id} in '{domain}': {lesson}")
     
     # Check for conflicts (simplified - just report if similar lessons exist)
@@ -193,8 +217,6 @@ def commit_meta_preference(conn, pref, dry_run=False):
             VALUES (?, ?, ?, ?, datetime('now'))
         """, (name, description, priority, source))
         print(f"   ✓ Added core value: {name}")
-    
-    conn.commit()
 
 def main():
     parser = argparse.ArgumentParser(description='Parse hex-reflect manifest and commit to HexMem')
@@ -231,29 +253,61 @@ def main():
     conn = sqlite3.connect(HEXMEM_DB)
     
     try:
-        # Commit observations
-        if obs_count > 0:
-            print("📊 Observations:")
-            for obs in data['observations']:
-                commit_observation(conn, obs, args.dry_run)
-            print()
-        
-        # Commit insights
-        if insight_count > 0:
-            print("💡 Insights:")
-            for insight in data['insights']:
-                commit_insight(conn, insight, args.dry_run)
-            print()
-        
-        # Commit meta-preferences
-        if pref_count > 0:
-            print("⚙️  Meta-Preferences:")
-            for pref in data['meta_preferences']:
-                commit_meta_preference(conn, pref, args.dry_run)
-            print()
-        
+        # One transaction for the whole manifest: items needing conflict or
+        # supersession handling go through the per-item commit_* path, the
+        # rest are bulk-inserted with executemany. A single commit at the
+        # end replaces one fsync per item, and errors roll back atomically.
+        with conn:
+            # Commit observations
+            if obs_count > 0:
+                print("📊 Observations:")
+                plain = [o for o in data['observations'] if o.get('action', 'new') != 'supersede']
+                supersedes = [o for o in data['observations'] if o.get('action', 'new') == 'supersede']
+                if plain and not args.dry_run:
+                    conn.executemany("""
+                        INSERT INTO facts (
+                            subject_text, predicate, object_text, object_type,
+                            confidence, source, source_session, created_at
+                        ) VALUES (?, ?, ?, 'string', ?, 'reflection', ?, datetime('now'))
+                    """, [observation_row(o) for o in plain])
+                    for o in plain:
+                        print(f"   ✓ Added fact: {o.get('subject', 'hex')} | {o.get('predicate', 'observed')} | {o.get('object', '')}")
+                else:
+                    for obs in plain:
+                        commit_observation(conn, obs, args.dry_run)
+                for obs in supersedes:
+                    commit_observation(conn, obs, args.dry_run)
+                print()
+
+            # Commit insights
+            if insight_count > 0:
+                print("💡 Insights:")
+                plain = [i for i in data['insights'] if i.get('action', 'new') != 'supersede']
+                supersedes = [i for i in data['insights'] if i.get('action', 'new') == 'supersede']
+                if plain and not args.dry_run:
+                    conn.executemany("""
+                        INSERT INTO lessons (
+                            domain, lesson, context, confidence, source_event_id, created_at
+                        ) VALUES (?, ?, ?, ?, ?, datetime('now'))
+                    """, [insight_row(i) for i in plain])
+                    for i in plain:
+                        print(f"   ✓ Added lesson in '{i.get('domain', 'general')}': {i.get('lesson', '')}")
+                else:
+                    for insight in plain:
+                        commit_insight(conn, insight, args.dry_run)
+                for insight in supersedes:
+                    commit_insight(conn, insight, args.dry_run)
+                print()
+
+            # Commit meta-preferences (need per-item existence checks)
+            if pref_count > 0:
+                print("⚙️  Meta-Preferences:")
+                for pref in data['meta_preferences']:
+                    commit_meta_preference(conn, pref, args.dry_run)
+                print()
+
         print("✅ Manifest processing complete")
-        
+
     finally:
         conn.close()
 
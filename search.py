@@ -6,92 +6,161 @@ Usage: python search.py "query" [--limit N] [--source TYPE]
 """
 
 import argparse
-import json
 import os
 import sqlite3
 import sys
+from collections import namedtuple
 
 # Add parent directory for embed module
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from embed import get_db_path, load_sqlite_vec, generate_embedding, serialize_embedding
-
-
-def get_content(conn, source: str, item_id: int) -> dict:
-    """Fetch the actual content for a search result."""
-    if source == 'events':
-        cur = conn.execute("""
-            SELECT summary, details, category, occurred_at 
-            FROM events WHERE id = ?
-        """, (item_id,))
-        row = cur.fetchone()
-        if row:
-            return {
-                'summary': row[0],
-                'details': row[1],
-                'category': row[2],
-                'date': row[3]
-            }
-    
-    elif source == 'lessons':
-        cur = conn.execute("""
-            SELECT lesson, context, domain, confidence
-            FROM lessons WHERE id = ?
-        """, (item_id,))
-        row = cur.fetchone()
-        if row:
-            return {
-                'lesson': row[0],
-                'context': row[1],
-                'domain': row[2],
-                'confidence': row[3]
-            }
-    
-    elif source == 'entities':
-        cur = conn.execute("""
-            SELECT name, entity_type, description
-            FROM entities WHERE id = ?
-        """, (item_id,))
-        row = cur.fetchone()
-        if row:
-            return {
-                'name': row[0],
-                'type': row[1],
-                'description': row[2]
-            }
-    
-    elif source == 'facts':
-        cur = conn.execute("""
-            SELECT subject_text, predicate, object_text
-            FROM facts WHERE id = ?
-        """, (item_id,))
-        row = cur.fetchone()
-        if row:
-            return {
-                'subject': row[0],
-                'predicate': row[1],
-                'object': row[2]
-            }
-    
-    return {}
+# embed (and anything heavy it drags in) is imported lazily inside the
+# functions that need it, so `search.py --help` and argparse errors don't
+# pay the model-library import cost
 
+# connect_readonly may hand back an apsw connection, whose errors don't
+# subclass sqlite3's - catch both wherever vec queries can fail
+try:
+    import apsw
+    _DB_ERRORS = (sqlite3.OperationalError, apsw.Error)
+except ImportError:
+    _DB_ERRORS = (sqlite3.OperationalError,)
+
+# Small persistent cache of query embeddings: repeated CLI searches for the
+# same query skip the model load+encode entirely (the dominant latency).
+_QCACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'hexmem')
+_QCACHE_MAX = 256
+
+
+def _qcache_path():
+    """Cache file for the active embedding backend.
+
+    One file per backend: vectors from different models have different
+    dims, so a hit from another backend would silently break every vec
+    MATCH downstream.
+    """
+    backend = os.environ.get('HEXMEM_EMBED_BACKEND', 'minilm')
+    return os.path.join(_QCACHE_DIR, f'qcache-{backend}.npz')
+
+
+def embed_query(query: str):
+    """Return the embedding for a query, cached on disk by exact text.
+
+    A fuzzy near-duplicate match would still need the model to embed the
+    incoming query first, so only exact matches are cached - those are the
+    ones that can skip loading the model at all.
+    """
+    import numpy as np
+    from embed import generate_embedding
+
+    cache_path = _qcache_path()
+    cache = {}
+    try:
+        with np.load(cache_path) as f:
+            cache = dict(zip(f['queries'].tolist(), f['vectors']))
+    except (OSError, KeyError, ValueError):
+        pass
+
+    if query in cache:
+        return cache[query]
 
-def search_with_content(conn, query: str, source: str = None, limit: int = 10):
-    """Search and return results with full content."""
-    if not load_sqlite_vec(conn):
-        print("Cannot search without sqlite-vec extension", file=sys.stderr)
-        return []
-    
     embedding = generate_embedding(query)
-    embedding_blob = serialize_embedding(embedding)
-    
-    results = []
-    
-    tables_to_search = []
+    # Drop any stale entries whose shape no longer matches (e.g. the
+    # backend's model changed) rather than letting np.stack blow up
+    cache = {k: v for k, v in cache.items() if v.shape == embedding.shape}
+    cache[query] = embedding
+    # Evict oldest entries first (dict preserves insertion order)
+    for key in list(cache)[:max(0, len(cache) - _QCACHE_MAX)]:
+        del cache[key]
+
+    try:
+        os.makedirs(_QCACHE_DIR, exist_ok=True)
+        np.savez(cache_path,
+                 queries=np.array(list(cache), dtype=str),
+                 vectors=np.stack(list(cache.values())))
+    except (OSError, ValueError):
+        pass  # cache is best-effort
+
+    return embedding
+
+
+# Per-source content schema: (table, columns to fetch, result keys)
+SOURCE_SCHEMA = {
+    'events': ('events',
+               ('summary', 'details', 'category', 'occurred_at'),
+               ('summary', 'details', 'category', 'date')),
+    'lessons': ('lessons',
+                ('lesson', 'context', 'domain', 'confidence'),
+                ('lesson', 'context', 'domain', 'confidence')),
+    'entities': ('entities',
+                 ('name', 'entity_type', 'description'),
+                 ('name', 'type', 'description')),
+    'facts': ('facts',
+              ('subject_text', 'predicate', 'object_text'),
+              ('subject', 'predicate', 'object')),
+}
+
+
+# Single-row content statements, built once: constant SQL text means
+# SQLite's prepared-statement cache hits instead of re-parsing per call
+SQL_GET_CONTENT = {
+    src: f"SELECT {', '.join(columns)} FROM {table} WHERE id = ?"
+    for src, (table, columns, _keys) in SOURCE_SCHEMA.items()
+}
+
+
+# Content rows are namedtuples, not dicts: one cached type per source
+# instead of a fresh keyed dict allocation per row. They only become
+# dicts at the JSON boundary (to_jsonable).
+CONTENT_TYPES = {
+    src: namedtuple(f"{src.rstrip('s').capitalize()}Content", keys)
+    for src, (_table, _columns, keys) in SOURCE_SCHEMA.items()
+}
+
+
+def get_contents(conn, source: str, item_ids) -> dict:
+    """Fetch content for all hits in one source with a single IN query."""
+    schema = SOURCE_SCHEMA.get(source)
+    if not schema or not item_ids:
+        return {}
+    table, columns, _keys = schema
+    make = CONTENT_TYPES[source]._make
+    placeholders = ','.join('?' * len(item_ids))
+    cur = conn.execute(f"""
+        SELECT id, {', '.join(columns)}
+        FROM {table} WHERE id IN ({placeholders})
+    """, list(item_ids))
+    return {row[0]: make(row[1:]) for row in cur}
+
+
+def get_content(conn, source: str, item_id: int):
+    """Fetch the actual content for a single search result, or None."""
+    sql = SQL_GET_CONTENT.get(source)
+    if not sql:
+        return None
+    row = conn.execute(sql, (item_id,)).fetchone()
+    if not row:
+        return None
+    return CONTENT_TYPES[source]._make(row)
+
+
+def _build_search_sql(conn, embedding, source: str = None):
+    """Build the fused KNN query over the vec tables.
+
+    One UNION ALL across the sources: the embedding binds once and
+    SQLite's sorter keeps the global top-k, replacing four separate
+    queries plus a Python-side sort. knn_subquery picks the right KNN
+    form per table (vec0 MATCH..k, or vectorlite HNSW under HEXMEM_ANN).
+    Returns (sql, query_blob), or (None, None) for an unknown source.
+    """
+    from embed import knn_subquery, query_blob
+
     if source:
         vec_tables = {
             'events': 'vec_events',
-            'lessons': 'vec_lessons', 
+            'lessons': 'vec_lessons',
             'facts': 'vec_facts',
             'entities': 'vec_entities',
         }
@@ -103,96 +172,458 @@ def search_with_content(conn, query: str, source: str = None, limit: int = 10):
             ('facts', 'vec_facts'),
             ('entities', 'vec_entities'),
         ]
-    
+
+    subqueries = []
     for src, vec_table in tables_to_search:
         if not vec_table:
             continue
-        
+
         id_col = f"{src.rstrip('s')}_id" if src != 'entities' else 'entity_id'
-        
+        subqueries.append(knn_subquery(conn, src, vec_table, id_col))
+
+    if not subqueries:
+        return None, None
+
+    # Match the query blob to the tables' storage type (float32 or int8)
+    embedding_blob = query_blob(conn, embedding, tables_to_search[0][1])
+
+    # A lone vec0 subquery rejects an outer LIMIT next to its k = :k
+    # constraint (and SQLite flattens a wrapping subselect), so --source
+    # runs the subquery as-is: k already bounds and orders the rows. The
+    # compound keeps the outer clause, where the LIMIT is legal.
+    if len(subqueries) == 1:
+        sql = subqueries[0]
+    else:
+        sql = " UNION ALL ".join(subqueries) + " ORDER BY distance LIMIT :k"
+    return sql, embedding_blob
+
+
+def _bruteforce_rows(conn, embedding, source: str = None, limit: int = 10):
+    """Brute-force (source, id, distance) rows when sqlite-vec can't load.
+
+    Only helps where the vec_* tables are readable without the vec0
+    module (e.g. mirrored as regular tables); vec0 virtual tables need
+    the extension even for plain SELECTs, in which case this returns [].
+    """
+    import numpy as np
+    from _bruteforce import topk
+
+    vec_tables = {
+        'events': ('vec_events', 'event_id'),
+        'lessons': ('vec_lessons', 'lesson_id'),
+        'facts': ('vec_facts', 'fact_id'),
+        'entities': ('vec_entities', 'entity_id'),
+    }
+    sources = [source] if source else list(vec_tables)
+
+    merged = []
+    for src in sources:
+        table, id_col = vec_tables.get(src, (None, None))
+        if not table:
+            continue
         try:
-            cur = conn.execute(f"""
-                SELECT {id_col}, distance
-                FROM {vec_table}
-                WHERE embedding MATCH ?
-                ORDER BY distance
-                LIMIT ?
-            """, (embedding_blob, limit))
-            
-            for row in cur.fetchall():
-                content = get_content(conn, src, row[0])
-                results.append({
-                    'source': src,
-                    'id': row[0],
-                    'distance': round(row[1], 4),
-                    'content': content
-                })
-        except sqlite3.OperationalError:
-            pass
-    
-    results.sort(key=lambda x: x['distance'])
-    return results[:limit]
+            rows = conn.execute(f"SELECT {id_col}, embedding FROM {table}").fetchall()
+        except _DB_ERRORS:
+            continue
+        if not rows:
+            continue
+        mat = np.frombuffer(b''.join(r[1] for r in rows),
+                            dtype=np.float32).reshape(len(rows), -1)
+        idx, dist = topk(mat, np.asarray(embedding, dtype=np.float32), limit)
+        merged.extend((src, rows[i][0], float(d)) for i, d in zip(idx, dist))
+
+    merged.sort(key=lambda r: r[2])
+    return merged[:limit]
+
+
+def iter_results(conn, query: str, source: str = None, limit: int = 10,
+                 embedding=None):
+    """Yield search results with content in distance order, as rows arrive.
+
+    Streaming variant of search_with_content for interactive output: the
+    top match is yielded as soon as SQLite produces it instead of after
+    all sources are scanned and every content row fetched. Content is
+    looked up per row here, so batch consumers should prefer
+    search_with_content and its grouped lookups.
+    """
+    from embed import load_sqlite_vec
+
+    if embedding is None:
+        embedding = embed_query(query)
+
+    if not load_sqlite_vec(conn):
+        print("Warning: sqlite-vec unavailable, using brute-force fallback",
+              file=sys.stderr)
+        for src, item_id, distance in _bruteforce_rows(conn, embedding, source, limit):
+            yield {
+                'source': src,
+                'id': item_id,
+                'distance': distance,
+                'content': get_content(conn, src, item_id)
+            }
+        return
+
+    sql, embedding_blob = _build_search_sql(conn, embedding, source)
+    if sql is None:
+        return
+
+    try:
+        cur = conn.execute(sql, {'q': embedding_blob, 'k': limit})
+    except _DB_ERRORS as e:
+        print(f"Warning: vector search failed: {e}", file=sys.stderr)
+        return
+
+    for src, item_id, distance in cur:
+        yield {
+            'source': src,
+            'id': item_id,
+            'distance': distance,
+            'content': get_content(conn, src, item_id)
+        }
+
+
+def search_with_content(conn, query: str, source: str = None, limit: int = 10,
+                        embedding=None):
+    """Search and return results with full content."""
+    from embed import load_sqlite_vec
+
+    results = []
+
+    if embedding is None:
+        embedding = embed_query(query)
+
+    if not load_sqlite_vec(conn):
+        print("Warning: sqlite-vec unavailable, using brute-force fallback",
+              file=sys.stderr)
+        rows = _bruteforce_rows(conn, embedding, source, limit)
+    else:
+        sql, embedding_blob = _build_search_sql(conn, embedding, source)
+        if sql is None:
+            return results
+        try:
+            rows = conn.execute(sql, {'q': embedding_blob, 'k': limit})
+        except _DB_ERRORS as e:
+            # Vec tables might not exist yet - run embed.py --init-vec first
+            print(f"Warning: vector search failed: {e}", file=sys.stderr)
+            return results
+
+    # One pass over the cursor (no fetchall buffer-then-reiterate),
+    # bucketing ids for the grouped content lookups as rows stream in
+    buffered = []
+    ids_by_src = {}
+    for row in rows:
+        buffered.append(row)
+        ids_by_src.setdefault(row[0], []).append(row[1])
+    rows = buffered
+    contents = {src: get_contents(conn, src, ids) for src, ids in ids_by_src.items()}
+
+    # Rounding is deferred to the output stage - no float re-allocation
+    # per row in the assembly loop
+    for src, item_id, distance in rows:
+        results.append({
+            'source': src,
+            'id': item_id,
+            'distance': distance,
+            'content': contents[src].get(item_id)
+        })
+
+    return results
+
+
+def _truncate(s: str, n: int) -> str:
+    return s[:n] + '...' if len(s) > n else s
+
+
+def _fmt_event(content, lines):
+    lines.append(f"  📅 {(content.date or 'unknown')[:10]} | {content.category or 'unknown'}")
+    lines.append(f"  {content.summary or 'No summary'}")
+    if content.details:
+        lines.append(f"  └─ {_truncate(content.details, 100)}")
+
+
+def _fmt_lesson(content, lines):
+    lines.append(f"  💡 [{content.domain or 'general'}] {content.lesson or 'No lesson'}")
+    if content.context:
+        lines.append(f"  └─ Context: {content.context[:80]}")
+
+
+def _fmt_entity(content, lines):
+    lines.append(f"  🏷️ {content.name or 'Unknown'} ({content.type or 'unknown'})")
+    if content.description:
+        lines.append(f"  └─ {content.description[:100]}")
+
+
+def _fmt_fact(content, lines):
+    lines.append(f"  📌 {content.subject or '?'} → {content.predicate or '?'} → {content.object or '?'}")
+
+
+# Table-driven dispatch instead of an if/elif chain per result
+FORMATTERS = {
+    'events': _fmt_event,
+    'lessons': _fmt_lesson,
+    'entities': _fmt_entity,
+    'facts': _fmt_fact,
+}
 
 
 def format_result(result: dict) -> str:
     """Format a single result for display."""
     source = result['source']
-    content = result['content']
-    distance = result['distance']
-    
-    lines = [f"[{source}] (distance: {distance})"]
-    
-    if source == 'events':
-        lines.append(f"  📅 {content.get('date', 'unknown')[:10]} | {content.get('category', 'unknown')}")
-        lines.append(f"  {content.get('summary', 'No summary')}")
-        if content.get('details'):
-            details = content['details'][:100] + '...' if len(content.get('details', '')) > 100 else content.get('details', '')
-            lines.append(f"  └─ {details}")
-    
-    elif source == 'lessons':
-        lines.append(f"  💡 [{content.get('domain', 'general')}] {content.get('lesson', 'No lesson')}")
-        if content.get('context'):
-            lines.append(f"  └─ Context: {content.get('context', '')[:80]}")
-    
-    elif source == 'entities':
-        lines.append(f"  🏷️ {content.get('name', 'Unknown')} ({content.get('type', 'unknown')})")
-        if content.get('description'):
-            lines.append(f"  └─ {content.get('description', '')[:100]}")
-    
-    elif source == 'facts':
-        lines.append(f"  📌 {content.get('subject', '?')} → {content.get('predicate', '?')} → {content.get('object', '?')}")
-    
+    lines = [f"[{source}] (distance: {result['distance']:.4f})"]
+
+    formatter = FORMATTERS.get(source)
+    if formatter and result['content'] is not None:
+        formatter(result['content'], lines)
+
     return '\n'.join(lines)
 
 
+def _dumps(obj) -> str:
+    """Serialize for --json output: orjson (C-level, several times faster
+    than stdlib json) when installed, stdlib json otherwise."""
+    try:
+        import orjson
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    except ImportError:
+        import json
+        return json.dumps(obj, indent=2)
+
+
+def to_jsonable(results):
+    """Prepare results for JSON output: round distances, flatten the
+    namedtuple content into dicts. Run once at the serialization boundary
+    so the hot path never allocates keyed dicts per row."""
+    for result in results:
+        result['distance'] = round(result['distance'], 4)
+        content = result['content']
+        result['content'] = content._asdict() if content is not None else {}
+    return results
+
+
+def _connect_apsw(db_path):
+    """Read-only apsw connection with sqlite-vec loaded, or None.
+
+    apsw binds parameters and builds rows with less per-call overhead
+    than stdlib sqlite3 and releases the GIL more aggressively, which
+    shows up on the many short get_content point queries.
+    """
+    try:
+        import apsw
+    except ImportError:
+        return None
+
+    try:
+        conn = apsw.Connection(db_path, flags=apsw.SQLITE_OPEN_READONLY)
+    except apsw.Error:
+        return None
+    conn.execute("PRAGMA query_only = 1")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 1073741824")
+    conn.execute("PRAGMA cache_size = -65536")
+
+    # apsw spells extension loading differently from stdlib sqlite3, so
+    # sqlite-vec is loaded here rather than via embed.load_sqlite_vec
+    # (whose vec_version() probe then sees it as already loaded)
+    try:
+        import sqlite_vec
+        conn.enableloadextension(True)
+        conn.loadextension(sqlite_vec.loadable_path())
+        try:
+            import vectorlite_py
+            conn.loadextension(vectorlite_py.vectorlite_path())
+        except Exception:
+            pass
+        conn.enableloadextension(False)
+    except Exception as e:
+        print(f"Warning: Could not load sqlite-vec via apsw: {e}",
+              file=sys.stderr)
+        return None
+    return conn
+
+
+def connect_readonly():
+    """Open the read-only search connection with the usual PRAGMAs set.
+
+    Uses apsw when installed (lower per-call binding overhead), stdlib
+    sqlite3 otherwise - both expose the execute() subset used here.
+    """
+    from embed import get_db_path, load_sqlite_vec
+
+    conn = _connect_apsw(get_db_path())
+    if conn is not None:
+        return conn
+
+    # Search never writes: a read-only connection skips write-path
+    # bookkeeping and is safe to share across threads. The db is
+    # already in WAL mode (set by embed.py), so readers don't block.
+    try:
+        conn = sqlite3.connect(f"file:{get_db_path()}?mode=ro", uri=True,
+                               check_same_thread=False)
+    except sqlite3.OperationalError:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+    # query_only skips per-statement write-lock bookkeeping; mmap turns
+    # the many small content point-lookups into page-cache reads
+    conn.execute("PRAGMA query_only = 1")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 1073741824")
+    conn.execute("PRAGMA cache_size = -65536")
+    load_sqlite_vec(conn)
+    return conn
+
+
+def query_daemon(query: str, source: str, limit: int):
+    """Ask a resident search daemon; returns results, or None to fall back.
+
+    The daemon (search_daemon.py) keeps the model and connection loaded
+    across invocations, so a round-trip over its socket replaces the
+    whole model-load + extension-load cost. On the first call the daemon
+    isn't running yet: spawn it detached and wait for the socket to bind.
+    """
+    import json
+    import socket
+    import subprocess
+    import time
+
+    from search_daemon import default_socket_path
+
+    sock_path = default_socket_path()
+    client = None
+    for attempt in range(2):
+        try:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.settimeout(60)
+            client.connect(sock_path)
+            break
+        except OSError:
+            client.close()
+            client = None
+            if attempt:
+                return None
+            daemon_py = os.path.join(
+                os.path.dirname(os.path.abspath(__file__)), 'search_daemon.py')
+            subprocess.Popen([sys.executable, daemon_py],
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL,
+                             start_new_session=True)
+            # Give the daemon time to load the model and bind the socket
+            deadline = time.monotonic() + 30
+            while time.monotonic() < deadline and not os.path.exists(sock_path):
+                time.sleep(0.1)
+
+    try:
+        with client, client.makefile('rwb') as f:
+            f.write(json.dumps({'query': query, 'source': source,
+                                'limit': limit}).encode() + b'\n')
+            f.flush()
+            line = f.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
 def main():
     parser = argparse.ArgumentParser(description='HexMem Semantic Search')
-    parser.add_argument('query', help='Search query')
+    parser.add_argument('query', nargs='?', help='Search query')
     parser.add_argument('--limit', '-l', type=int, default=5, help='Max results')
     parser.add_argument('--source', '-s', choices=['events', 'lessons', 'facts', 'entities'],
                        help='Limit to specific source')
     parser.add_argument('--json', '-j', action='store_true', help='Output as JSON')
-    
+    parser.add_argument('--queries-file', '-f',
+                        help='File with one query per line, embedded as a single batch')
+
     args = parser.parse_args()
-    
+
+    if not args.query and not args.queries_file:
+        parser.error('a query or --queries-file is required')
+
+    # Resident-daemon mode: one process keeps the model loaded across CLI
+    # invocations and answers over a Unix socket. Opt-in, like the other
+    # HEXMEM_* switches - it leaves a background process running.
+    if os.environ.get('HEXMEM_SEARCH_DAEMON') == '1' and not args.queries_file:
+        results = query_daemon(args.query, args.source, args.limit)
+        if results is not None:
+            if args.json:
+                print(_dumps(results))
+            else:
+                print(f"\n🔍 Search: \"{args.query}\"\n")
+                print("-" * 60)
+                for result in results:
+                    # Daemon responses arrive as JSON dicts; rehydrate the
+                    # content namedtuple the formatters expect
+                    ctype = CONTENT_TYPES.get(result['source'])
+                    if result['content'] and ctype:
+                        result['content'] = ctype(**result['content'])
+                    else:
+                        result['content'] = None
+                    print(format_result(result))
+                    print()
+            return
+        print("Warning: search daemon unavailable, searching in-process",
+              file=sys.stderr)
+
     # Suppress model loading messages
     import warnings
     warnings.filterwarnings('ignore')
     os.environ['TOKENIZERS_PARALLELISM'] = 'false'
     
-    conn = sqlite3.connect(get_db_path())
-    results = search_with_content(conn, args.query, args.source, args.limit)
-    conn.close()
-    
+    if args.queries_file:
+        # Bulk mode: embed every query in one forward pass instead of N
+        # batch-1 encodes, then search per query on the shared connection
+        from embed import generate_embedding_batch
+
+        with open(args.queries_file) as f:
+            queries = [line.strip() for line in f if line.strip()]
+        if not queries:
+            print("No queries in file", file=sys.stderr)
+            sys.exit(1)
+
+        embeddings = generate_embedding_batch(queries)
+        conn = connect_readonly()
+
+        if args.json:
+            grouped = []
+            for query, embedding in zip(queries, embeddings):
+                results = search_with_content(conn, query, args.source,
+                                              args.limit, embedding=embedding)
+                grouped.append({'query': query, 'results': to_jsonable(results)})
+            print(_dumps(grouped))
+        else:
+            for query, embedding in zip(queries, embeddings):
+                print(f"\n🔍 Search: \"{query}\"\n")
+                print("-" * 60)
+                for result in iter_results(conn, query, args.source, args.limit,
+                                           embedding=embedding):
+                    print(format_result(result))
+                    print()
+
+        conn.close()
+        return
+
+    # Embedding compute and connection/extension setup are independent -
+    # kick off the embedding on a worker thread so the two overlap
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        embed_future = pool.submit(embed_query, args.query)
+        conn = connect_readonly()
+        embedding = embed_future.result()
+
     if args.json:
-        print(json.dumps(results, indent=2))
+        results = search_with_content(conn, args.query, args.source, args.limit,
+                                      embedding=embedding)
+        print(_dumps(to_jsonable(results)))
     else:
+        # Stream: print each match as it arrives rather than waiting for
+        # the full result list
         print(f"\n🔍 Search: \"{args.query}\"\n")
         print("-" * 60)
-        for result in results:
+        for result in iter_results(conn, args.query, args.source, args.limit,
+                                   embedding=embedding):
             print(format_result(result))
             print()
 
+    conn.close()
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+HexMem Search Daemon
+
+Keeps the embedding model and SQLite connection resident behind a Unix
+domain socket, so CLI searches skip the per-invocation model/extension
+load cost (typically 0.5-2s) and run in the millisecond regime.
+
+Protocol: one JSON request line per connection
+    {"query": "...", "limit": 5, "source": "events"}
+answered with one JSON line containing the result list.
+
+Usage: python search_daemon.py [--socket PATH]
+"""
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+
+# Add parent directory for embed module
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def default_socket_path():
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return os.path.join(runtime_dir, 'hexmem.sock')
+
+
+def serve(sock_path):
+    from embed import get_db_path, load_sqlite_vec, warmup
+    from search import search_with_content, to_jsonable
+
+    conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+    load_sqlite_vec(conn)
+    warmup()
+
+    try:
+        os.unlink(sock_path)
+    except OSError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sock_path)
+    server.listen(8)
+    print(f"hexmem search daemon listening on {sock_path}")
+
+    while True:
+        client, _ = server.accept()
+        try:
+            with client, client.makefile('rwb') as f:
+                line = f.readline()
+                if not line:
+                    continue
+                req = json.loads(line)
+                results = search_with_content(
+                    conn, req.get('query', ''),
+                    req.get('source'), int(req.get('limit', 5)))
+                f.write(json.dumps(to_jsonable(results)).encode() + b'\n')
+                f.flush()
+        except Exception as e:
+            print(f"request failed: {e}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HexMem Search Daemon')
+    parser.add_argument('--socket', default=default_socket_path(),
+                        help='Unix socket path (default: $XDG_RUNTIME_DIR/hexmem.sock)')
+    args = parser.parse_args()
+
+    try:
+        serve(args.socket)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        try:
+            os.unlink(args.socket)
+        except OSError:
+            pass
+
+
+if __name__ == '__main__':
+    main()